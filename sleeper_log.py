@@ -4,12 +4,221 @@ from datetime import datetime
 from collections import defaultdict, Counter
 import numpy as np
 import os
+import re
 import argparse
 import subprocess
-from InquirerPy import inquirer
+import sys
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import groupby
+from operator import itemgetter
+from string import Template
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Dict, Optional
 
+# orjson is optional; it decodes the large players payload several times faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Upper bound on in-flight API requests, kept modest so a fetch doesn't trip Sleeper's
+# rate limits; also sizes the HTTP connection pool so every worker thread can keep
+# its own connection alive
+MAX_CONCURRENT_REQUESTS = 8
+
+# Per-request timeout (seconds) and retry policy for transient API failures. Once the
+# retries run out the last response is returned rather than raised, so callers' status
+# checks still skip a failing optional endpoint instead of aborting the whole report
+REQUEST_TIMEOUT = 10
+REQUEST_RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504),
+                      raise_on_status=False)
+
+# Sleeper asks clients to pull the (multi-MB) NFL player list at most once a day
+PLAYERS_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "sleeper_log", "players_nfl.json")
+PLAYERS_CACHE_TTL = 24 * 60 * 60
+
+# Weeks with league matchups (weeks 1-18). All of them are requested even when the
+# NFL state says the season is earlier: future weeks carry the upcoming schedule, and
+# the state week means nothing for a past season's league.
+MATCHUP_WEEKS = range(1, 19)
+
+# ANSI escape codes used in the text report and their HTML equivalents
+_ANSI_TO_HTML = {
+    '92': '<span style="color: #00ff00;">',  # Green
+    '91': '<span style="color: #ff0000;">',  # Red
+    '93': '<span style="color: #ffff00;">',  # Yellow
+    '32': '<span style="color: #00ff00;">',  # Green (32)
+    '1': '<b>',  # Bold start
+    '0': '</b></span>',  # Reset closes bold and color span if present
+}
+# ANSI sequences used to highlight starters and winners
+_BOLD_GREEN = "\033[1m\033[32m"
+_RESET = "\033[0m"
+
+# Matches either an ANSI code or a run of spaces (kept as &nbsp; to preserve alignment)
+_ANSI_RE = re.compile(r'\033\[(92|91|93|32|1|0)m| {2,}')
+
+
+def _ansi_to_html_sub(match):
+    code = match.group(1)
+    if code is None:
+        return '&nbsp;' * len(match.group())
+    return _ANSI_TO_HTML[code]
+
+# Report banner; filled in by create_ascii_header
+_HEADER_TMPL = (
+    "            /ZZ  \033[1mLEAGUE:\033[0m {name:<39}   /ZZ      \n"
+    "           | ZZ  \033[1mSEASON:\033[0m {season:<41}| ZZ      \n"
+    "   /ZZZZZZZ| ZZ  /ZZZZZZ   /ZZZZZZ   /ZZZZZZ   /ZZZZZZ   /ZZZZZZ  | ZZ  /ZZZZZZ   /ZZZZZZ \n"
+    "  /ZZ_____/| ZZ /ZZ__  ZZ /ZZ__  ZZ /ZZ__  ZZ /ZZ__  ZZ /ZZ__  ZZ | ZZ /ZZ__  ZZ /ZZ__  ZZ\n"
+    " |  ZZZZZZ | ZZ| ZZZZZZZZ| ZZZZZZZZ| ZZ  \\ ZZ| ZZZZZZZZ| ZZ  \\__/ | ZZ| ZZ  \\ ZZ| ZZ  \\ ZZ\n"
+    "  \\____  ZZ| ZZ| ZZ_____/| ZZ_____/| ZZ  | ZZ| ZZ_____/| ZZ       | ZZ| ZZ  | ZZ| ZZ  | ZZ\n"
+    "  /ZZZZZZZ/| ZZ|  ZZZZZZZ|  ZZZZZZZ| ZZZZZZZ/|  ZZZZZZZ| ZZ       | ZZ|  ZZZZZZ/|  ZZZZZZZ\n"
+    " |_______/ |__/ \\_______/ \\_______/| ZZ____/  \\_______/|__//ZZZZZZ|__/ \\______/  \\____  ZZ\n"
+    "                                   | ZZ                   |______/               /ZZ  \\ ZZ\n"
+    "                                   | ZZ  \033[1mGEN :\033[0m {now:<33}|  ZZZZZZ/\n"
+    "                                   |__/  \033[1mWEEK:\033[0m {week:0>2}                                \\______/\n\n"
+)
+
+# Section title box with a centered title; formatted once per section below
+_SECTION_HEADER_TMPL = (
+    " /ZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZ[ - O X]\n"
+    "| ZZ                                                                                     ZZ\n"
+    "| ZZ{title:^93}ZZ\n"
+    "| ZZ                                                                                     ZZ\n"
+    "| ZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZ\n"
+    "|_________________________________________________________________________________________/\n\n"
+)
+
+# The report's fixed section headers, rendered once at import
+_STANDINGS_HEADER = _SECTION_HEADER_TMPL.format(title="\033[1mSTANDINGS\033[0m")
+_ANALYTICS_HEADER = _SECTION_HEADER_TMPL.format(title="\033[1mLEAGUE ANALYTICS\033[0m")
+_ROSTERS_HEADER = _SECTION_HEADER_TMPL.format(title="\033[1mTEAM ROSTERS\033[0m")
+_PLAYOFF_HEADER = _SECTION_HEADER_TMPL.format(title="\033[1mPLAYOFF PICTURE\033[0m")
+_DRAFT_HEADER = _SECTION_HEADER_TMPL.format(title="\033[1mDRAFT SUMMARY\033[0m")
+_SCHEDULE_HEADER = _SECTION_HEADER_TMPL.format(title="\033[1mSCHEDULE\033[0m")
+
+# Report footer; filled in by create_footer
+_FOOTER_TMPL = (
+    " /ZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZ[ - O X]\n"
+    "| ZZ                                                                                     ZZ\n"
+    "| ZZ                      Generated by \033[1msleeper_log\033[0m commit \033[1m#{commit_hash}\033[0m                       ZZ\n"
+    "| ZZ                      https://github.com/keithalbe/sleeper_log                       ZZ\n"
+    "| ZZ                      Vibe coded with: \033[1mSonnet 4\033[0m, \033[1mGPT-5\033[0m, \033[1mCursor\033[0m                       ZZ\n"
+    "| ZZ                                                                                     ZZ\n"
+    "| ZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZ\n"
+    "|_________________________________________________________________________________________/\n"
+)
+
+# HTML page wrapping the converted report; a string.Template so the CSS braces need no escaping
+_HTML_TMPL = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>$title - sleeper_log Report</title>
+    <style>
+        body {
+            font-family: 'Monaco', 'Menlo', 'Ubuntu Mono', 'Consolas', 'Courier New', monospace;
+            background-color: #0d1117;
+            color: #c9d1d9;
+            margin: 20px;
+            padding: 20px;
+            line-height: 1.2;
+            font-size: 13px;
+        }
+        
+        pre {
+            white-space: pre;
+            margin: 0;
+            padding: 0;
+            overflow-x: auto;
+        }
+        
+        /* GitHub-style terminal colors */
+        .terminal {
+            background-color: #161b22;
+            border: 1px solid #30363d;
+            border-radius: 8px;
+            padding: 20px;
+            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3);
+        }
+        
+        /* Custom styles for better readability */
+        .header {
+            color: #58a6ff;
+            font-weight: bold;
+        }
+        
+        .emoji {
+            font-size: 1.1em;
+        }
+        
+        /* Ensure Unicode characters render properly */
+        .blocks {
+            letter-spacing: -0.1em;
+        }
+        
+        @media (max-width: 768px) {
+            body {
+                margin: 10px;
+                padding: 10px;
+                font-size: 11px;
+            }
+        }
+    </style>
+</head>
+<body>
+    <div class="terminal">
+        <pre class="blocks">$body</pre>
+    </div>
+    
+    <script>
+        // Add some interactivity
+        document.addEventListener('DOMContentLoaded', function() {
+            console.log('sleeper-cli HTML report loaded 🏈');
+        });
+    </script>
+</body>
+</html>""")
+
+def load_json(response):
+    """Decode a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+# Roster position lines hold up to three cells; every cell but a line's third is followed
+# by a two-space gap, and continuation lines are indented to align under the first name
+_ROW_TMPLS = {1: "{}  ", 2: "{}  {}  ", 3: "{}  {}  {}"}
+_ROW_BREAK = "\n" + " " * 13
+
+def _roster_rows(cells):
+    """Lay out roster cells three per line"""
+    rows = (cells[i:i + 3] for i in range(0, len(cells), 3))
+    return _ROW_BREAK.join(_ROW_TMPLS[len(row)].format(*row) for row in rows)
+
+def _intern(value):
+    """sys.intern for strings; other values (e.g. null fields) pass through unchanged"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+def new_session():
+    """Create a keep-alive session with a pool for every worker thread and retries"""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_maxsize=MAX_CONCURRENT_REQUESTS, max_retries=REQUEST_RETRY))
+    return session
+
+
+@lru_cache(maxsize=1)
 def get_git_commit_hash():
+    # CI systems usually export the commit; only fork git when they don't
+    commit = os.environ.get("GIT_COMMIT")
+    if commit:
+        return commit[:7]
     try:
         result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], 
                               capture_output=True, text=True, cwd=os.path.dirname(__file__))
@@ -20,8 +229,9 @@ def get_git_commit_hash():
     return "unknown"
 
 class SleeperLog:
-    def __init__(self, league_id):
+    def __init__(self, league_id, refresh_players=False):
         self.league_id = league_id
+        self.refresh_players = refresh_players
         self.base_url = "https://api.sleeper.app/v1"
         self.league_data = None
         self.users = {}
@@ -32,100 +242,295 @@ class SleeperLog:
         self.max_week_with_data = 0
         self.draft_picks = []
         self.winners_bracket = []
+        self._roster_by_id = {}
+        self._team_name_by_roster = {}
+        self._roster_by_team_name = {}
+        self._points_by_roster = {}
+        self._roster_ids = []
+        self._roster_idx = {}
+        self._scores = np.empty((0, 0))
+        self._player_names = {}
+        self._player_pos_team = {}
+        self._player_full_names = {}
+        self._players_points = {}
+        self._week_points = {}
+        self._latest_points = {}
+        self._matchup_groups = {}
+        self._matchup_count = 0
+        self._weekly_results = {}
+        self._standings = None
+        self._seed_by_team = None
+        self._leaders = None
+
+        # Reuse TLS connections across all API calls instead of a new handshake per request
+        self.session = new_session()
         
     def fetch_league_data(self):
         print("Fetching league data from Sleeper API...")
-        
-        # Get league info
+        # Derived results are only valid for the data they were computed from
+        self._standings = None
+        self._seed_by_team = None
+        self._leaders = None
+
+        # None of these endpoints depend on each other, so issue them all at once
+        # and let the total wait collapse to roughly the slowest single request
         league_url = f"{self.base_url}/league/{self.league_id}"
-        response = requests.get(league_url)
-        if response.status_code != 200:
-            raise Exception(f"Failed to fetch league data: {response.status_code}")
-        self.league_data = response.json()
-        
+        urls = {
+            'league': league_url,
+            'state': f"{self.base_url}/state/nfl",
+            'users': f"{league_url}/users",
+            'rosters': f"{league_url}/rosters",
+            'winners_bracket': f"{league_url}/winners_bracket",
+            'drafts': f"{league_url}/drafts",
+        }
+        cached_players = self._load_cached_players()
+        if cached_players is None:
+            urls['players'] = f"{self.base_url}/players/nfl"
+        # Get matchups (fetch all regular season weeks regardless of current NFL week)
+        for week in MATCHUP_WEEKS:
+            urls[week] = f"{league_url}/matchups/{week}"
+
+        get = partial(self.session.get, timeout=REQUEST_TIMEOUT)
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            futures = {key: executor.submit(get, url) for key, url in urls.items()}
+
+            # Get league info
+            response = futures['league'].result()
+            if response.status_code != 200:
+                raise Exception(f"Failed to fetch league data: {response.status_code}")
+            self.league_data = load_json(response)
+
+            # Get draft data; the picks request is chained onto the drafts response
+            # so it still overlaps with the rest of the batch (e.g. the players payload)
+            picks_future = None
+            draft_response = futures['drafts'].result()
+            if draft_response.status_code == 200:
+                try:
+                    drafts = load_json(draft_response)
+                    if drafts:
+                        # Get the most recent draft
+                        latest_draft = drafts[0]
+                        draft_id = latest_draft.get('draft_id')
+                        if draft_id:
+                            picks_url = f"{self.base_url}/draft/{draft_id}/picks"
+                            picks_future = executor.submit(get, picks_url)
+                except Exception:
+                    pass
+
+            responses = {key: future.result() for key, future in futures.items()}
+            # A failed picks request only means there is no draft summary, not a failed run
+            picks_response = None
+            if picks_future is not None:
+                try:
+                    picks_response = picks_future.result()
+                except Exception:
+                    pass
+
         # Get current week
-        state_url = f"{self.base_url}/state/nfl"
-        state_response = requests.get(state_url)
+        state_response = responses['state']
         if state_response.status_code == 200:
-            state_data = state_response.json()
+            state_data = load_json(state_response)
             self.current_week = state_data.get('week', 1)
-        
+
         # Get users
-        print("Fetching users...")
-        users_url = f"{self.base_url}/league/{self.league_id}/users"
-        users_response = requests.get(users_url)
+        users_response = responses['users']
         if users_response.status_code == 200:
-            users_list = users_response.json()
+            users_list = load_json(users_response)
             self.users = {user['user_id']: user for user in users_list}
-        
+
         # Get rosters
-        print("Fetching rosters...")
-        rosters_url = f"{self.base_url}/league/{self.league_id}/rosters"
-        rosters_response = requests.get(rosters_url)
+        rosters_response = responses['rosters']
         if rosters_response.status_code == 200:
-            self.rosters = rosters_response.json()
-        
-        # Get matchups (fetch all regular season weeks regardless of current NFL week)
-        print("Fetching matchups...")
+            self.rosters = load_json(rosters_response)
+
         self.matchups = {}
-        for week in range(1, 19):  # Weeks 1-18
-            matchup_url = f"{self.base_url}/league/{self.league_id}/matchups/{week}"
-            matchup_response = requests.get(matchup_url)
+        for week in MATCHUP_WEEKS:
+            matchup_response = responses[week]
             if matchup_response.status_code == 200:
-                week_data = matchup_response.json()
+                week_data = load_json(matchup_response)
                 if week_data:  # Only store weeks that have data
                     self.matchups[week] = week_data
-                    self.max_week_with_data = max(self.max_week_with_data, week)
-        
+        self.max_week_with_data = max(self.matchups, default=0)
+
         # Get players
-        print("Fetching player data...")
-        players_url = f"{self.base_url}/players/nfl"
-        players_response = requests.get(players_url)
-        if players_response.status_code == 200:
-            self.players = players_response.json()
+        if cached_players is not None:
+            self.players = cached_players
+        else:
+            players_response = responses['players']
+            if players_response.status_code == 200:
+                # Keep only the fields the report reads; each raw entry carries ~30 more
+                self.players = {
+                    pid: {
+                        'first_name': p.get('first_name', ''),
+                        'last_name': p.get('last_name', ''),
+                        'full_name': p.get('full_name', 'Unknown'),
+                        'position': p.get('position', 'UNK'),
+                        'team': p.get('team', 'UNK'),
+                    }
+                    for pid, p in load_json(players_response).items()
+                }
+                self._save_cached_players()
 
         # Get winners bracket (playoffs)
-        print("Fetching winners bracket...")
-        wb_url = f"{self.base_url}/league/{self.league_id}/winners_bracket"
-        wb_response = requests.get(wb_url)
+        wb_response = responses['winners_bracket']
         if wb_response.status_code == 200:
             try:
-                self.winners_bracket = wb_response.json() or []
+                self.winners_bracket = load_json(wb_response) or []
             except Exception:
                 self.winners_bracket = []
-        
-        # Get draft data
-        print("Fetching draft data...")
-        draft_url = f"{self.base_url}/league/{self.league_id}/drafts"
-        draft_response = requests.get(draft_url)
-        if draft_response.status_code == 200:
+
+        if picks_response is not None and picks_response.status_code == 200:
             try:
-                drafts = draft_response.json()
-                if drafts:
-                    # Get the most recent draft
-                    latest_draft = drafts[0]
-                    draft_id = latest_draft.get('draft_id')
-                    if draft_id:
-                        picks_url = f"{self.base_url}/draft/{draft_id}/picks"
-                        picks_response = requests.get(picks_url)
-                        if picks_response.status_code == 200:
-                            self.draft_picks = picks_response.json()
-                        else:
-                            self.draft_picks = []
-                    else:
-                        self.draft_picks = []
-                else:
-                    self.draft_picks = []
+                # Draft order, so anything grouping the picks gets each group already in order
+                self.draft_picks = sorted(load_json(picks_response),
+                                          key=lambda p: (p.get('round', 0), p.get('pick_no', 0)))
             except Exception:
                 self.draft_picks = []
         else:
             self.draft_picks = []
-        
+
+        self._build_indexes()
+        # The lookup tables hold everything the report reads; don't keep the whole NFL player list alive
+        self.players = {}
         print("Data fetch complete!")
+
+    def _build_indexes(self):
+        """Precompute lookup tables used throughout report generation"""
+        self._roster_by_id = {r['roster_id']: r for r in self.rosters}
+        self._team_name_by_roster = {rid: self._lookup_team_name(rid) for rid in self._roster_by_id}
+        self._roster_by_team_name = {}
+        for roster in self.rosters:
+            # Keep the first roster for duplicate names, like the linear scan this replaces
+            self._roster_by_team_name.setdefault(self._team_name_by_roster[roster['roster_id']], roster)
+
+        # Flat per-player lookups for the roster rendering hot path
+        self._player_names = {
+            pid: f"{p.get('first_name', '')} {p.get('last_name', '')}".strip()
+            for pid, p in self.players.items()
+        }
+        # Positions and NFL teams are a few dozen distinct codes repeated across thousands of
+        # players; interning shares one object per code and makes the position checks pointer compares
+        self._player_pos_team = {
+            pid: (_intern(p.get('position', 'UNK')), _intern(p.get('team', 'UNK')))
+            for pid, p in self.players.items()
+        }
+        self._player_full_names = {pid: p.get('full_name', 'Unknown') for pid, p in self.players.items()}
+
+        # Per-player and team scores keyed by (roster_id, week), keeping the first matchup row like the old scans
+        self._players_points = {}
+        self._week_points = {}
+        for week, week_matchups in self.matchups.items():
+            for matchup in week_matchups:
+                key = (matchup['roster_id'], week)
+                self._players_points.setdefault(key, matchup.get('players_points', {}))
+                self._week_points.setdefault(key, float(matchup.get('points', 0) or 0))
+        # Each player's most recent non-zero score per roster, for O(1) projections;
+        # walking newest week first, the first score seen for a pair is the latest
+        self._latest_points = {}
+        for roster_id, week in sorted(self._players_points, key=itemgetter(1), reverse=True):
+            for player_id, points in self._players_points[(roster_id, week)].items():
+                if points and points > 0:
+                    self._latest_points.setdefault((roster_id, player_id), float(points))
+
+        # (rosters x weeks) matrix of completed-game scores; NaN marks weeks without one
+        # Rows follow the order teams first post a score in the matchups (then everyone else), so
+        # argmin/argmax ties go to the same team the original stable min/max over matchups chose
+        first_scored = {}
+        for week_matchups in self.matchups.values():
+            for matchup in week_matchups:
+                if matchup.get('points', 0) > 0 and matchup['roster_id'] in self._roster_by_id:
+                    first_scored.setdefault(matchup['roster_id'])
+        self._roster_ids = list(first_scored) + [rid for rid in self._roster_by_id if rid not in first_scored]
+        self._roster_idx = {rid: i for i, rid in enumerate(self._roster_ids)}
+        self._scores = np.full((len(self._roster_ids), self.max_week_with_data), np.nan)
+        for week, week_matchups in self.matchups.items():
+            for matchup in week_matchups:
+                idx = self._roster_idx.get(matchup['roster_id'])
+                points = matchup.get('points', 0)
+                if idx is not None and points > 0:
+                    self._scores[idx, week - 1] = points
+
+        # Season point totals in one pass over all matchups. Plain left-to-right addition in
+        # matchup order, not a nansum over the matrix: pairwise float sums can land a total
+        # on the other side of a .x5 boundary and change the rounded figure in the report
+        self._points_by_roster = defaultdict(float)
+        for week_matchups in self.matchups.values():
+            for matchup in week_matchups:
+                points = matchup.get('points', 0)
+                # Only count points from completed games
+                if points > 0:
+                    self._points_by_roster[matchup['roster_id']] += points
+
+        # Each week's matchup rows grouped by matchup_id, shared by the results and the schedule
+        self._matchup_groups = {}
+        for week, week_matchups in self.matchups.items():
+            groups = self._matchup_groups[week] = defaultdict(list)
+            for matchup in week_matchups:
+                groups[matchup.get('matchup_id')].append(matchup)
+        # Per week, so a week with an unpaired row doesn't count half a matchup
+        self._matchup_count = sum(len(m) // 2 for m in self.matchups.values())
+
+        # W/L/T per roster for the 17 regular season weeks, pairing each team with its opponent
+        self._weekly_results = {}
+        for week in range(1, 18):
+            week_matchups = self.matchups.get(week)
+            if not week_matchups:
+                continue
+            by_matchup_id = self._matchup_groups[week]
+
+            seen = set()
+            for matchup in week_matchups:
+                roster_id = matchup['roster_id']
+                if roster_id in seen:
+                    continue  # Only a team's first matchup row counts
+                seen.add(roster_id)
+                results = self._weekly_results.setdefault(roster_id, ['-'] * 17)
+
+                team_points = matchup.get('points', 0)
+                opponent_points = next((m.get('points', 0) for m in by_matchup_id[matchup.get('matchup_id')]
+                                        if m['roster_id'] != roster_id), 0)
+                # Only count as played if both teams have scores > 0
+                if team_points > 0 and opponent_points > 0:
+                    if team_points > opponent_points:
+                        results[week - 1] = 'W'
+                    elif team_points < opponent_points:
+                        results[week - 1] = 'L'
+                    else:
+                        results[week - 1] = 'T'  # Tie
+
+    def _load_cached_players(self):
+        """Return the cached player list if it is fresh enough, otherwise None"""
+        if self.refresh_players:
+            return None
+        try:
+            if time.time() - os.path.getmtime(PLAYERS_CACHE_PATH) < PLAYERS_CACHE_TTL:
+                with open(PLAYERS_CACHE_PATH, 'rb') as f:
+                    data = f.read()
+                return orjson.loads(data) if orjson is not None else json.loads(data)
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _save_cached_players(self):
+        # Write to a temp file and swap it in so an interrupted run never leaves a truncated cache
+        tmp_path = PLAYERS_CACHE_PATH + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(PLAYERS_CACHE_PATH), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                if orjson is not None:
+                    f.write(orjson.dumps(self.players))
+                else:
+                    f.write(json.dumps(self.players).encode('utf-8'))
+            os.replace(tmp_path, PLAYERS_CACHE_PATH)
+        except OSError:
+            pass
     
     def get_team_name(self, roster_id):
         """Get team name for a roster"""
-        roster = next((r for r in self.rosters if r['roster_id'] == roster_id), None)
+        return self._team_name_by_roster.get(roster_id, f"Team {roster_id}")
+
+    def _lookup_team_name(self, roster_id):
+        roster = self._roster_by_id.get(roster_id)
         if not roster:
             return f"Team {roster_id}"
         
@@ -139,49 +544,35 @@ class SleeperLog:
                 f"Team {roster_id}")
     
     def get_player_name(self, player_id):
-        if not player_id or player_id not in self.players:
-            return "Unknown Player"
-        
-        player = self.players[player_id]
-        return f"{player.get('first_name', '')} {player.get('last_name', '')}".strip()
+        return self._player_names.get(player_id, "Unknown Player")
     
     def get_player_position_team(self, player_id):
-        if not player_id or player_id not in self.players:
-            return "UNK", "UNK"
-        
-        player = self.players[player_id]
-        return player.get('position', 'UNK'), player.get('team', 'UNK')
+        return self._player_pos_team.get(player_id, ("UNK", "UNK"))
     
-    # Create a section header with a centered title
-    def create_section_header(self, title):
-        return f" /ZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZ[ - O X]\n" \
-                "| ZZ                                                                                     ZZ\n" \
-               f"| ZZ{title:^93}ZZ\n"                                                                           \
-                "| ZZ                                                                                     ZZ\n" \
-                "| ZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZ\n" \
-                "|_________________________________________________________________________________________/\n\n"
-
     def calculate_standings(self):
         """Calculate current standings"""
+        # Several sections need the standings; the data is fixed once fetched, so compute them once
+        if self._standings is None:
+            self._standings = self._compute_standings()
+        return self._standings
+
+    def _get_seed_by_team(self):
+        """Playoff seed (standings position, 1-based) for each team name"""
+        if self._seed_by_team is None:
+            self._seed_by_team = {t['team']: i + 1 for i, t in enumerate(self.calculate_standings())}
+        return self._seed_by_team
+
+    def _compute_standings(self):
         standings = []
         
         for roster in self.rosters:
             team_name = self.get_team_name(roster['roster_id'])
             
-            total_points = 0
+            total_points = self._points_by_roster.get(roster['roster_id'], 0)
             wins = roster.get('settings', {}).get('wins', 0)
             losses = roster.get('settings', {}).get('losses', 0)
             ties = roster.get('settings', {}).get('ties', 0)
             
-            # Calculate points from matchups (only completed games)
-            for week, week_matchups in self.matchups.items():
-                for matchup in week_matchups:
-                    if matchup['roster_id'] == roster['roster_id']:
-                        points = matchup.get('points', 0)
-                        # Only count points from completed games
-                        if points > 0 and week <= self.max_week_with_data:
-                            total_points += points
-            
             standings.append({
                 'team': team_name,
                 'wins': wins,
@@ -191,63 +582,77 @@ class SleeperLog:
                 'points_against': roster.get('settings', {}).get('fpts_against', 0)
             })
         
-        standings.sort(key=lambda x: (x['wins'], x['points_for']), reverse=True)
+        standings.sort(key=itemgetter('wins', 'points_for'), reverse=True)
         return standings
     
     def get_league_leaders(self):
+        if self._leaders is None:
+            self._leaders = self._compute_league_leaders()
+        return self._leaders
+
+    def _compute_league_leaders(self):
         standings = self.calculate_standings()
         
-        highest_scorer = max(standings, key=lambda x: x['points_for'])
-        lowest_scorer = min(standings, key=lambda x: x['points_for'])
+        highest_scorer = max(standings, key=itemgetter('points_for'))
+        lowest_scorer = min(standings, key=itemgetter('points_for'))
         
-        # Weekly performance analysis
-        weekly_scores = defaultdict(list)
+        # One NaN mask of the score matrix serves both the per-week and per-team reductions
+        missing = np.isnan(self._scores)
+
+        # Weekly performance analysis: best and worst completed score in each week's column
         weekly_highs = {}
         weekly_lows = {}
+        has_week = ~missing.all(axis=0)
+        if has_week.any():
+            week_scores = self._scores[:, has_week]
+            week_highs = np.nanmax(week_scores, axis=0).tolist()
+            week_lows = np.nanmin(week_scores, axis=0).tolist()
+            for col, week in enumerate((np.flatnonzero(has_week) + 1).tolist()):
+                # Equal scores resolve in matchup row order: the first team with the high,
+                # the last with the low, as the original stable sort of each week did
+                rows = [self._roster_idx[m['roster_id']] for m in self.matchups[week]
+                        if m['roster_id'] in self._roster_idx]
+                column = self._scores[:, week - 1]
+                high, low = week_highs[col], week_lows[col]
+                high_row = next(r for r in rows if column[r] == high)
+                low_row = next(r for r in reversed(rows) if column[r] == low)
+                weekly_highs[week] = (self.get_team_name(self._roster_ids[high_row]), high)
+                weekly_lows[week] = (self.get_team_name(self._roster_ids[low_row]), low)
         
-        for week, week_matchups in self.matchups.items():
-            week_scores = []
-            for matchup in week_matchups:
-                team_name = self.get_team_name(matchup['roster_id'])
-                points = matchup.get('points', 0)
-                # Only include scores from completed games (both teams scored > 0 or week is completed)
-                if points > 0 and week <= self.max_week_with_data:
-                    weekly_scores[team_name].append(points)
-                    week_scores.append((team_name, points))
-            
-            if week_scores:
-                week_scores.sort(key=lambda x: x[1], reverse=True)
-                weekly_highs[week] = week_scores[0]
-                weekly_lows[week] = week_scores[-1]
-        
-        # Consistency analysis
+        # Consistency analysis, reduced across each team's row of the score matrix
         consistency_stats = {}
-        for team, scores in weekly_scores.items():
-            if scores:
-                # Only use scores from completed games
-                completed_scores = [s for s in scores if s > 0]
-                if completed_scores:
-                    consistency_stats[team] = {
-                        'avg': np.mean(completed_scores),
-                        'std': np.std(completed_scores),
-                        'high': max(completed_scores),
-                        'low': min(completed_scores)
-                    }
-        
-        most_consistent = min(consistency_stats.items(), 
-                            key=lambda x: x[1]['std']) if consistency_stats else None
-        most_volatile = max(consistency_stats.items(),
-                           key=lambda x: x[1]['std']) if consistency_stats else None
+        most_consistent = most_volatile = None
+        has_scores = ~missing.all(axis=1)
+        if has_scores.any():
+            scores = self._scores[has_scores]
+            avgs = np.nanmean(scores, axis=1)
+            stds = np.nanstd(scores, axis=1)
+            highs = np.nanmax(scores, axis=1)
+            lows = np.nanmin(scores, axis=1)
+            teams = [self.get_team_name(rid) for rid, keep in zip(self._roster_ids, has_scores) if keep]
+            for i, team in enumerate(teams):
+                consistency_stats[team] = {
+                    'avg': avgs[i],
+                    'std': stds[i],
+                    'high': highs[i],
+                    'low': lows[i]
+                }
+            steadiest, wildest = teams[np.argmin(stds)], teams[np.argmax(stds)]
+            most_consistent = (steadiest, consistency_stats[steadiest])
+            most_volatile = (wildest, consistency_stats[wildest])
         
         # Calculate over/under performers based on wins vs points
+        # Calculate expected wins based on points scored vs league: count, for every
+        # team at once, how many teams outscored it
+        points_for = np.array([team['points_for'] for team in standings])
+        better_records = (points_for[None, :] > points_for[:, None]).sum(axis=1)
+        expected_win_pcts = 1 - better_records / len(standings)
+
         expected_wins = []
-        for team in standings:
+        for team, expected_win_pct in zip(standings, expected_win_pcts.tolist()):
             team_name = team['team']
             actual_wins = team['wins']
             
-            # Calculate expected wins based on points scored vs league
-            better_records = sum(1 for other in standings if other['points_for'] > team['points_for'])
-            expected_win_pct = 1 - (better_records / len(standings))
             games_played = team['wins'] + team['losses'] + team['ties']
             expected = expected_win_pct * games_played if games_played > 0 else 0
             
@@ -261,9 +666,9 @@ class SleeperLog:
         
         # Sort by difference
         over_performers = sorted([t for t in expected_wins if t['difference'] > 0.5], 
-                               key=lambda x: x['difference'], reverse=True)
+                               key=itemgetter('difference'), reverse=True)
         under_performers = sorted([t for t in expected_wins if t['difference'] < -0.5], 
-                                key=lambda x: x['difference'])
+                                key=itemgetter('difference'))
 
         # Longest win and losing streaks
         def compute_streaks(sequence):
@@ -313,77 +718,30 @@ class SleeperLog:
         }
     
     def create_ascii_header(self):
-        return (
-            f"            /ZZ  \033[1mLEAGUE:\033[0m {self.league_data.get('name', '?'):<39}   /ZZ      \n"
-            f"           | ZZ  \033[1mSEASON:\033[0m {self.league_data.get('season', '?'):<41}| ZZ      \n"
-            "   /ZZZZZZZ| ZZ  /ZZZZZZ   /ZZZZZZ   /ZZZZZZ   /ZZZZZZ   /ZZZZZZ  | ZZ  /ZZZZZZ   /ZZZZZZ \n"
-            "  /ZZ_____/| ZZ /ZZ__  ZZ /ZZ__  ZZ /ZZ__  ZZ /ZZ__  ZZ /ZZ__  ZZ | ZZ /ZZ__  ZZ /ZZ__  ZZ\n"
-            " |  ZZZZZZ | ZZ| ZZZZZZZZ| ZZZZZZZZ| ZZ  \\ ZZ| ZZZZZZZZ| ZZ  \\__/ | ZZ| ZZ  \\ ZZ| ZZ  \\ ZZ\n"
-            "  \\____  ZZ| ZZ| ZZ_____/| ZZ_____/| ZZ  | ZZ| ZZ_____/| ZZ       | ZZ| ZZ  | ZZ| ZZ  | ZZ\n"
-            "  /ZZZZZZZ/| ZZ|  ZZZZZZZ|  ZZZZZZZ| ZZZZZZZ/|  ZZZZZZZ| ZZ       | ZZ|  ZZZZZZ/|  ZZZZZZZ\n"
-            " |_______/ |__/ \\_______/ \\_______/| ZZ____/  \\_______/|__//ZZZZZZ|__/ \\______/  \\____  ZZ\n"
-            "                                   | ZZ                   |______/               /ZZ  \\ ZZ\n"
-            f"                                   | ZZ  \033[1mGEN :\033[0m {datetime.now().strftime('%b %d, %Y @%I:%M %p'):<33}|  ZZZZZZ/\n"
-            f"                                   |__/  \033[1mWEEK:\033[0m {self.current_week:0>2}                                \\______/\n\n"
+        return _HEADER_TMPL.format(
+            name=self.league_data.get('name', '?'),
+            season=self.league_data.get('season', '?'),
+            now=datetime.now().strftime('%b %d, %Y @%I:%M %p'),
+            week=self.current_week,
         )
 
     
     def get_team_weekly_results(self, roster_id):
-        weekly_results = []
-        
-        for week in range(1, 18):  # 17 regular season weeks
-            if week in self.matchups:
-                week_matchups = self.matchups[week]
-                
-                # Find this team's matchup
-                team_matchup = None
-                for matchup in week_matchups:
-                    if matchup['roster_id'] == roster_id:
-                        team_matchup = matchup
-                        break
-                
-                if team_matchup:
-                    # Check if game has been played (both teams have scores > 0 or it's past the week)
-                    team_points = team_matchup.get('points', 0)
-                    matchup_id = team_matchup.get('matchup_id')
-                    opponent_points = 0
-                    
-                    for matchup in week_matchups:
-                        if (matchup.get('matchup_id') == matchup_id and 
-                            matchup['roster_id'] != roster_id):
-                            opponent_points = matchup.get('points', 0)
-                            break
-                    
-                    # Only count as played if both teams have scores > 0 AND it's a completed week
-                    if (team_points > 0 and opponent_points > 0) and week <= self.max_week_with_data:
-                        # Determine win/loss
-                        if team_points > opponent_points:
-                            weekly_results.append('W')
-                        elif team_points < opponent_points:
-                            weekly_results.append('L')
-                        else:
-                            weekly_results.append('T')  # Tie
-                    else:
-                        weekly_results.append('-')  # Game not played yet
-                else:
-                    weekly_results.append('-')  # No game data
-            else:
-                weekly_results.append('-')  # Future week or no data
-        
-        return weekly_results
+        # Future weeks, weeks without data and unplayed games are all '-'
+        return self._weekly_results.get(roster_id, ['-'] * 17)
 
     def create_standings_table(self):
         standings = self.calculate_standings()
         
-        output = self.create_section_header("\033[1mSTANDINGS\033[0m")
-        output += "      Rnk|Team         |1 |2 |3 |4 |5 |6 |7 |8 |9 |10|11|12|13|14|15|16|17|Rec |Pnts"
+        parts = [_STANDINGS_HEADER]
+        parts.append("      Rnk|Team         |1 |2 |3 |4 |5 |6 |7 |8 |9 |10|11|12|13|14|15|16|17|Rec |Pnts")
         
         for i, team in enumerate(standings):
             rank = i + 1
             team_name = team['team'][:12]  # Truncate to align with header 'Team Name'
             
             # Get roster for this team to find weekly results
-            roster = next((r for r in self.rosters if self.get_team_name(r['roster_id']) == team['team']), None)
+            roster = self._roster_by_team_name.get(team['team'])
             
             if roster:
                 weekly_results = self.get_team_weekly_results(roster['roster_id'])
@@ -412,418 +770,288 @@ class SleeperLog:
             rank_display = f"#{rank:<2}"
             
             points_str = f"{team['points_for']:06.1f}"
-            output += (
+            parts.append(
                 f"\n      {rank_display}|{team_name:<12} |{game_log}"
                 f"{record:<4}|{points_str:<6}"
             )
         
-        output += "\n"
-        return output
+        parts.append("\n")
+        return "".join(parts)
 
     def create_footer(self):
-        commit_hash = get_git_commit_hash()
-        return f" /ZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZ[ - O X]\n" \
-                "| ZZ                                                                                     ZZ\n" \
-               f"| ZZ                      Generated by \033[1msleeper_log\033[0m commit \033[1m#{commit_hash}\033[0m                       ZZ\n" \
-                "| ZZ                      https://github.com/keithalbe/sleeper_log                       ZZ\n" \
-               f"| ZZ                      Vibe coded with: \033[1mSonnet 4\033[0m, \033[1mGPT-5\033[0m, \033[1mCursor\033[0m                       ZZ\n" \
-                "| ZZ                                                                                     ZZ\n" \
-                "| ZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZ\n" \
-                "|_________________________________________________________________________________________/\n"
+        return _FOOTER_TMPL.format(commit_hash=get_git_commit_hash())
 
     def convert_ansi_to_html(self, text):
-        # Replace ANSI color codes with HTML
-        text = text.replace('\033[92m', '<span style="color: #00ff00;">')  # Green
-        text = text.replace('\033[91m', '<span style="color: #ff0000;">')  # Red  
-        text = text.replace('\033[93m', '<span style="color: #ffff00;">')  # Yellow
-        text = text.replace('\033[32m', '<span style="color: #00ff00;">')  # Green (32)
-        # Bold start/end
-        text = text.replace('\033[1m', '<b>')
-        # Reset closes bold and color span if present
-        text = text.replace('\033[0m', '</b></span>')
-        
-        # Convert spaces to non-breaking spaces to preserve alignment
-        # Replace multiple spaces with &nbsp; to maintain spacing
-        import re
-        text = re.sub(r' {2,}', lambda m: '&nbsp;' * len(m.group()), text)
-        
-        return text
+        # Replace ANSI color codes with HTML and runs of spaces with &nbsp; in a single pass
+        return _ANSI_RE.sub(_ansi_to_html_sub, text)
     
     def generate_html_report(self, filename="sleeper_log.html"):
         print("Generating HTML report...")
         
         # Get the text report
-        text_report = ""
-        text_report += self.create_ascii_header()
-        text_report += self.create_standings_table()
-        text_report += self.create_leaders_section()
-        text_report += self.create_roster_section()
-        text_report += self.create_schedule_section()
-        text_report += self.create_playoff_picture()
-        text_report += self.create_draft_summary()
-        text_report += self.create_footer()
+        text_report = "".join([
+            self.create_ascii_header(),
+            self.create_standings_table(),
+            self.create_leaders_section(),
+            self.create_roster_section(),
+            self.create_schedule_section(),
+            self.create_playoff_picture(),
+            self.create_draft_summary(),
+            self.create_footer(),
+        ])
         
         # Convert ANSI colors to HTML
         html_content = self.convert_ansi_to_html(text_report)
 
         # Wrap in HTML
-        full_html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{self.league_data.get('name', 'Fantasy League')} - sleeper_log Report</title>
-    <style>
-        body {{
-            font-family: 'Monaco', 'Menlo', 'Ubuntu Mono', 'Consolas', 'Courier New', monospace;
-            background-color: #0d1117;
-            color: #c9d1d9;
-            margin: 20px;
-            padding: 20px;
-            line-height: 1.2;
-            font-size: 13px;
-        }}
-        
-        pre {{
-            white-space: pre;
-            margin: 0;
-            padding: 0;
-            overflow-x: auto;
-        }}
-        
-        /* GitHub-style terminal colors */
-        .terminal {{
-            background-color: #161b22;
-            border: 1px solid #30363d;
-            border-radius: 8px;
-            padding: 20px;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3);
-        }}
-        
-        /* Custom styles for better readability */
-        .header {{
-            color: #58a6ff;
-            font-weight: bold;
-        }}
-        
-        .emoji {{
-            font-size: 1.1em;
-        }}
+        full_html = _HTML_TMPL.substitute(title=self.league_data.get('name', 'Fantasy League'), body=html_content)
         
-        /* Ensure Unicode characters render properly */
-        .blocks {{
-            letter-spacing: -0.1em;
-        }}
-        
-        @media (max-width: 768px) {{
-            body {{
-                margin: 10px;
-                padding: 10px;
-                font-size: 11px;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="terminal">
-        <pre class="blocks">{html_content}</pre>
-    </div>
-    
-    <script>
-        // Add some interactivity
-        document.addEventListener('DOMContentLoaded', function() {{
-            console.log('sleeper-cli HTML report loaded 🏈');
-        }});
-    </script>
-</body>
-</html>"""
-        
-        # Save HTML file
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(full_html)
+        # Save HTML file; encode once up front and skip the text layer's newline translation
+        with open(filename, 'wb') as f:
+            f.write(full_html.encode('utf-8'))
         print(f"HTML report saved to: {filename}")
         return filename
     
     def create_leaders_section(self):
         leaders = self.get_league_leaders()
         
-        output = self.create_section_header("\033[1mLEAGUE ANALYTICS\033[0m")
+        parts = [_ANALYTICS_HEADER]
         
         # Highest Scorer
         if leaders['highest_scorer']:
             hs = leaders['highest_scorer']
-            output += f"     🔥 HIGHEST SCORER: {hs['team']}\n"
-            output += f"        └─ {hs['points_for']:.1f} total points\n\n"
+            parts.append(f"     🔥 HIGHEST SCORER: {hs['team']}\n")
+            parts.append(f"        └─ {hs['points_for']:.1f} total points\n\n")
         
         # Most Consistent
         if leaders['most_consistent']:
             team, stats = leaders['most_consistent']
-            output += f"     🪨 MOST CONSISTENT: {team}\n"
-            output += f"        └─ {stats['avg']:.1f} avg ± {stats['std']:.1f} std dev\n\n"
+            parts.append(f"     🪨 MOST CONSISTENT: {team}\n")
+            parts.append(f"        └─ {stats['avg']:.1f} avg ± {stats['std']:.1f} std dev\n\n")
         
         # Most Volatile
         if leaders['most_volatile']:
             team, stats = leaders['most_volatile']
-            output += f"     🎢 BOOM OR BUST: {team}\n"
-            output += f"        └─ {stats['high']:.1f} high, {stats['low']:.1f} low (±{stats['std']:.1f})\n\n"
+            parts.append(f"     🎢 BOOM OR BUST: {team}\n")
+            parts.append(f"        └─ {stats['high']:.1f} high, {stats['low']:.1f} low (±{stats['std']:.1f})\n\n")
         
         # Over-performers
         if leaders['over_performers']:
-            output += "     🚀 OVER-PERFORMERS (Lucky with record vs points):\n"
+            parts.append("     🚀 OVER-PERFORMERS (Lucky with record vs points):\n")
             for perf in leaders['over_performers'][:3]:  # Top 3
-                output += f"        {perf['team'][:25]}: {perf['actual_wins']}-{perf['games_played']-perf['actual_wins']} record (+{perf['difference']:.1f} wins above expected)\n"
-            output += "\n"
+                parts.append(f"        {perf['team'][:25]}: {perf['actual_wins']}-{perf['games_played']-perf['actual_wins']} record (+{perf['difference']:.1f} wins above expected)\n")
+            parts.append("\n")
         
         # Under-performers  
         if leaders['under_performers']:
-            output += "     😤 UNDER-PERFORMERS (Unlucky with record vs points):\n"
+            parts.append("     😤 UNDER-PERFORMERS (Unlucky with record vs points):\n")
             for perf in leaders['under_performers'][:3]:  # Bottom 3
-                output += f"        {perf['team'][:25]}: {perf['actual_wins']}-{perf['games_played']-perf['actual_wins']} record ({perf['difference']:.1f} wins below expected)\n"
-            output += "\n"
+                parts.append(f"        {perf['team'][:25]}: {perf['actual_wins']}-{perf['games_played']-perf['actual_wins']} record ({perf['difference']:.1f} wins below expected)\n")
+            parts.append("\n")
 
         # Streaks
         if leaders.get('longest_win_streak'):
             team, length = leaders['longest_win_streak']
-            output += f"     🔥 LONGEST WIN STREAK: {team} — {length} in a row\n"
+            parts.append(f"     🔥 LONGEST WIN STREAK: {team} — {length} in a row\n")
         if leaders.get('longest_loss_streak'):
             team, length = leaders['longest_loss_streak']
-            output += f"     💤 LONGEST LOSING STREAK: {team} — {length} in a row\n"
+            parts.append(f"     💤 LONGEST LOSING STREAK: {team} — {length} in a row\n")
         if leaders.get('longest_win_streak') or leaders.get('longest_loss_streak'):
-            output += "\n"
+            parts.append("\n")
         
         # Weekly highs
         if leaders['weekly_highs']:
-            output += "     🚀 WEEKLY HIGH SCORES:\n"
+            parts.append("     🚀 WEEKLY HIGH SCORES:\n")
+            # Weeks come from the score matrix columns, so all of them have data
             for week, (team, score) in sorted(leaders['weekly_highs'].items()):
-                # Show only weeks we have data for
-                if self.max_week_with_data and week <= self.max_week_with_data:
-                    output += f"        └─ Week {week:2}: {team[:20]} ({score:.1f} pts)\n"
+                parts.append(f"        └─ Week {week:2}: {team[:20]} ({score:.1f} pts)\n")
             
         
         # Advanced Stats
-        if leaders['consistency_stats']:
-            all_averages = [stats['avg'] for stats in leaders['consistency_stats'].values()]
-            league_average = np.mean(all_averages)
+        consistency_stats = leaders['consistency_stats']
+        if consistency_stats:
+            all_averages = np.fromiter((stats['avg'] for stats in consistency_stats.values()),
+                                       dtype=np.float64, count=len(consistency_stats))
+            league_average = all_averages.mean()
             
-            output += f"     📊 LEAGUE AVERAGE SCORE: {league_average:.1f} points\n"
+            parts.append(f"     📊 LEAGUE AVERAGE SCORE: {league_average:.1f} points\n")
             
             # Teams above/below average
-            above_avg = sum(1 for avg in all_averages if avg > league_average)
-            below_avg = len(all_averages) - above_avg
+            above_avg = int((all_averages > league_average).sum())
+            below_avg = all_averages.size - above_avg
             
-            output += f"     📈 TEAMS ABOVE AVERAGE: {above_avg}\n"
-            output += f"     📉 TEAMS BELOW AVERAGE: {below_avg}\n"
-            output += "\n"
+            parts.append(f"     📈 TEAMS ABOVE AVERAGE: {above_avg}\n")
+            parts.append(f"     📉 TEAMS BELOW AVERAGE: {below_avg}\n")
+            parts.append("\n")
             
             
-            # Score distribution
-            all_scores = []
-            for stats in leaders['consistency_stats'].values():
-                all_scores.extend([stats['high'], stats['low']])
-            
-            if all_scores:
-                output += f"     🎯 League High Score: {max(all_scores):.1f}\n"
-                output += f"     💀 League Low Score: {min(all_scores):.1f}\n"
-                output += f"     📊 Score Range: {max(all_scores) - min(all_scores):.1f} points\n"
+            # Score distribution; the league extremes are reductions over every completed
+            # score in the matrix (the same values as the max of the highs / min of the lows)
+            high_score = np.nanmax(self._scores)
+            low_score = np.nanmin(self._scores)
+            parts.append(f"     🎯 League High Score: {high_score:.1f}\n")
+            parts.append(f"     💀 League Low Score: {low_score:.1f}\n")
+            parts.append(f"     📊 Score Range: {high_score - low_score:.1f} points\n")
                 
         
         # Matchup records
-        total_matchups = sum(len(matchups) // 2 for matchups in self.matchups.values())
-        output += f"     ⚔️ Total Matchups Played: {total_matchups}{'':<60}\n"
+        # Every week lists both sides of each matchup, so halve the row count once
+        parts.append(f"     ⚔️ Total Matchups Played: {self._matchup_count}{'':<60}\n")
         
-        return output
+        return "".join(parts)
     
     def get_player_stats(self, player_id, roster_id):
-        last_week_points = 0
-        projection = 0
+        """Return (last week's points, projection) for a player, always as floats"""
+        last_week_points = 0.0
         
         # Get last week's points based on data availability
         last_completed_week = (self.max_week_with_data or self.current_week) - 1
-        if last_completed_week >= 1 and last_completed_week in self.matchups:
-            last_week_matchups = self.matchups[last_completed_week]
-            for matchup in last_week_matchups:
-                if matchup['roster_id'] == roster_id:
-                    players_points = matchup.get('players_points', {})
-                    last_week_points = players_points.get(player_id, 0)
-                    break
-        
-        # For projections, use the most recent week with data for this player
-        # Look through all weeks to find the most recent non-zero score
-        for week in sorted(self.matchups.keys(), reverse=True):
-            if week in self.matchups:
-                week_matchups = self.matchups[week]
-                for matchup in week_matchups:
-                    if matchup['roster_id'] == roster_id:
-                        players_points = matchup.get('players_points', {})
-                        player_points = players_points.get(player_id, 0)
-                        if player_points > 0:
-                            projection = player_points
-                            return last_week_points, projection
+        if last_completed_week >= 1:
+            players_points = self._players_points.get((roster_id, last_completed_week), {})
+            last_week_points = float(players_points.get(player_id) or 0.0)
         
-        # If no historical data, use last week's points as projection
-        projection = last_week_points if last_week_points > 0 else 0.0
+        # For projections, use the most recent non-zero score for this player
+        projection = self._latest_points.get((roster_id, player_id))
+        if projection is None:
+            # If no historical data, use last week's points as projection
+            projection = last_week_points if last_week_points > 0 else 0.0
         
         return last_week_points, projection
     
     def create_roster_section(self):
-        output = self.create_section_header("\033[1mTEAM ROSTERS\033[0m")
+        return _ROSTERS_HEADER + "".join(map(self._render_one_roster, self.rosters))
+
+    def _render_one_roster(self, roster):
+        parts = []
+        team_name = self.get_team_name(roster['roster_id'])
         
-        for roster in self.rosters:
-            team_name = self.get_team_name(roster['roster_id'])
-            
-            players = roster.get('players', []) or []
-            starters = roster.get('starters', []) or []
-            taxi = roster.get('taxi', []) or []
-            reserve = roster.get('reserve', []) or []  # IR
-            
-            if not players:
-                output += f"      \033[1m{team_name.upper()}\033[0m (0.0 pts)\n"
-                output += "      " + "─" * 79 + "\n"
-                output += "      No players found\n\n"
-                continue
-            
-            # Group all players by position
-            all_players = players + (reserve or [])
-            players_by_position = defaultdict(list)
-            
-            for player_id in all_players:
-                if player_id:
-                    player_name = self.get_player_name(player_id)
-                    position, nfl_team = self.get_player_position_team(player_id)
-                    last_points, projection = self.get_player_stats(player_id, roster['roster_id'])
-                    
-                    # Mark IR players
-                    if reserve and player_id in reserve:
-                        player_name = f"{player_name} (IR)"
-                    
-                    players_by_position[position].append({
-                        'name': player_name,
-                        'team': nfl_team,
-                        'points': last_points,
-                        'projection': projection,
-                        'is_starter': player_id in (starters or [])
-                    })
-            
-            # Sort players within each position (starters first, then by points)
-            for pos in players_by_position:
-                players_by_position[pos].sort(key=lambda x: (not x['is_starter'], -(x['points'] or 0)), reverse=False)
-            
-            # Display by position
-            position_order = ['QB', 'RB', 'WR', 'TE', 'FLX', 'K', 'DEF']
-            total_starter_points = 0
-            
-            for pos in position_order:
-                if pos in players_by_position:
-                    players_in_pos = players_by_position[pos]
-                    if not players_in_pos:
-                        continue
-                    
-                    # Position header
-                    pos_display = 'DEF' if pos == 'DEF' else pos
-                    output += f"      {pos_display:<3} :: "
-                    
-                    # Group players into lines of 3
-                    for i, player in enumerate(players_in_pos):
-                        if i > 0 and i % 3 == 0:
-                            # New line, indent to align with names
-                            output += "\n      " + " " * 7
-                        
-                        # Format player name and projection
-                        name = player['name'][:15]  # Allow longer names
-                        projection = player['projection'] if isinstance(player['projection'], (int, float)) else 0.0
-                        proj_str = f"({projection:03.1f})"
-                        
-                        # Color the starter green and bold
-                        if player['is_starter']:
-                            padded_name = f"\033[1m\033[32m{name:<15}\033[0m"  # Bold green
-                            total_starter_points += projection
-                        else:
-                            padded_name = f"{name:<15}"
-                        
-                        # Add player to line with proper alignment (fixed width for names and projections)
-                        # Pad the name to 20 characters, then add the projection
-                        if i % 3 == 2:  # Last player on line
-                            output += f"{padded_name} {proj_str:<6}"
-                        else:  # Not last player, add spacing
-                            output += f"{padded_name} {proj_str:<6}  "
-                    
-                    output += "\n"
-            
-            # Handle other positions not in the main order
-            for pos, players_in_pos in players_by_position.items():
-                if pos not in position_order and players_in_pos:
-                    output += f"      {pos:<3} :: "
+        players = roster.get('players', []) or []
+        starters = roster.get('starters', []) or []
+        taxi = roster.get('taxi', []) or []
+        reserve = roster.get('reserve', []) or []  # IR
+        
+        if not players:
+            parts.append(f"      \033[1m{team_name.upper()}\033[0m (0.0 pts)\n")
+            parts.append("      " + "─" * 79 + "\n")
+            parts.append("      No players found\n\n")
+            return "".join(parts)
+        
+        # Group all players by position
+        all_players = players + (reserve or [])
+        players_by_position = defaultdict(list)
+        # Hash sets so the per-player membership checks don't rescan the lists
+        starter_set = frozenset(starters)
+        reserve_set = frozenset(reserve)
+        
+        for player_id in all_players:
+            if player_id:
+                player_name = self.get_player_name(player_id)
+                position, nfl_team = self.get_player_position_team(player_id)
+                last_points, projection = self.get_player_stats(player_id, roster['roster_id'])
+                
+                # Mark IR players
+                if player_id in reserve_set:
+                    player_name = f"{player_name} (IR)"
+                
+                is_starter = player_id in starter_set
+                players_by_position[position].append({
+                    'name': player_name,
+                    'team': nfl_team,
+                    'points': last_points,
+                    'projection': projection,
+                    'is_starter': is_starter,
+                    # Fixed-width display pieces, formatted once per player
+                    'name15': player_name[:15].ljust(15),
+                    'proj_str': f"({projection:03.1f})".ljust(6),
+                    # Starters first, then by points
+                    'sort_key': (not is_starter, -last_points),
+                })
+        
+        # Sort players within each position
+        sort_key = itemgetter('sort_key')
+        for players_in_pos in players_by_position.values():
+            players_in_pos.sort(key=sort_key)
+        
+        # Display by position
+        position_order = ['QB', 'RB', 'WR', 'TE', 'FLX', 'K', 'DEF']
+        total_starter_points = 0
+        
+        for pos in position_order:
+            if pos in players_by_position:
+                players_in_pos = players_by_position[pos]
+                if not players_in_pos:
+                    continue
+                
+                # Position header
+                pos_display = 'DEF' if pos == 'DEF' else pos
+                
+                # Fixed width for names and projections; color the starter green and bold
+                cells = []
+                for player in players_in_pos:
+                    if player['is_starter']:
+                        cells.append(f"{_BOLD_GREEN}{player['name15']}{_RESET} {player['proj_str']}")
+                        total_starter_points += player['projection']
+                    else:
+                        cells.append(f"{player['name15']} {player['proj_str']}")
+                parts.append(f"      {pos_display:<3} :: {_roster_rows(cells)}\n")
+        
+        # Handle other positions not in the main order
+        for pos, players_in_pos in players_by_position.items():
+            if pos not in position_order and players_in_pos:
+                cells = []
+                for player in players_in_pos:
+                    name = player['name'][:15]
+                    projection = player['projection']
+                    proj_str = f"({projection:04.1f})"
                     
-                    for i, player in enumerate(players_in_pos):
-                        if i > 0 and i % 3 == 0:
-                            output += "\n      " + " " * 7
-                        
-                        name = player['name'][:15]
-                        projection = player['projection'] if isinstance(player['projection'], (int, float)) else 0.0
-                        proj_str = f"({projection:04.1f})"
-                        
-                        if player['is_starter']:
-                            name = f"\033[1m\033[32m{name}\033[0m"  # Bold green
-                            total_starter_points += projection
-                        
-                        # Pad the name to 20 characters, then add the projection
-                        padded_name = f"{name:<20}"
-                        if i % 3 == 2:
-                            output += f"{padded_name} {proj_str:<8}"
-                        else:
-                            output += f"{padded_name} {proj_str:<8}  "
+                    if player['is_starter']:
+                        name = f"{_BOLD_GREEN}{name}{_RESET}"
+                        total_starter_points += projection
                     
-                    output += "\n"
-            
-            # Print team name header with projection after calculating total
-            output += f"      \033[1m{team_name.upper()}\033[0m ({total_starter_points:.1f} pts)\n\n"
+                    # Pad the name to 20 characters, then add the projection
+                    cells.append(f"{name:<20} {proj_str:<8}")
+                parts.append(f"      {pos:<3} :: {_roster_rows(cells)}\n")
+        
+        # Print team name header with projection after calculating total
+        parts.append(f"      \033[1m{team_name.upper()}\033[0m ({total_starter_points:.1f} pts)\n\n")
+        
+        # TAXI (for dynasty leagues) - full width
+        if taxi:
+            parts.append(f"      >> TAXI SQUAD :: {team_name.upper()}\n")
+            parts.append("      " + "─" * 47 + "\n")
             
-            # TAXI (for dynasty leagues) - full width
-            if taxi:
-                output += f"      >> TAXI SQUAD :: {team_name.upper()}\n"
-                output += "      " + "─" * 47 + "\n"
-                
-                for player_id in taxi:
-                    player_name = self.get_player_name(player_id)[:15]
-                    position, nfl_team = self.get_player_position_team(player_id)
-                    last_points, projection = self.get_player_stats(player_id, roster['roster_id'])
-                    
-                    display_pos = 'DST' if position == 'DEF' else position
-                    taxi_points = last_points if isinstance(last_points, (int, float)) else 0.0
-                    nfl_team_disp = nfl_team if isinstance(nfl_team, str) and nfl_team else '---'
-                    output += f"      {display_pos:<4} :: {player_name:<15} ({nfl_team_disp:>3}) {taxi_points:>5.1f}\n"
+            for player_id in taxi:
+                player_name = self.get_player_name(player_id)[:15]
+                position, nfl_team = self.get_player_position_team(player_id)
+                last_points, projection = self.get_player_stats(player_id, roster['roster_id'])
                 
-                output += "      " + "─" * 47 + "\n\n"
+                display_pos = 'DST' if position == 'DEF' else position
+                nfl_team_disp = nfl_team if isinstance(nfl_team, str) and nfl_team else '---'
+                parts.append(f"      {display_pos:<4} :: {player_name:<15} ({nfl_team_disp:>3}) {last_points:>5.1f}\n")
             
-        return output
+            parts.append("      " + "─" * 47 + "\n\n")
+
+        return "".join(parts)
     
     def create_playoff_picture(self):
-        output = self.create_section_header("\033[1mPLAYOFF PICTURE\033[0m")
+        parts = [_PLAYOFF_HEADER]
 
         if not self.winners_bracket:
-            output += "      No playoff bracket data available.\n\n"
-            return output
+            parts.append("      No playoff bracket data available.\n\n")
+            return "".join(parts)
 
-        # Build seed map from standings order (best to worst)
-        standings = self.calculate_standings()
-        team_to_seed = {t['team']: i + 1 for i, t in enumerate(standings)}
-        rosterid_to_team = {r['roster_id']: self.get_team_name(r['roster_id']) for r in self.rosters}
+        # Seeds follow standings order (best to worst)
+        team_to_seed = self._get_seed_by_team()
+        rosterid_to_team = self._team_name_by_roster
 
-        # Index bracket by round then matchup_id
-        rounds = defaultdict(list)
-        for g in self.winners_bracket:
-            rounds[g.get('round', 0)].append(g)
+        # Order the bracket by round then matchup_id, so each round is one contiguous run
+        bracket = sorted(self.winners_bracket, key=lambda g: (g.get('round', 0), g.get('matchup_id', 0)))
 
         def score_for_week(roster_id: int, week: int) -> float:
-            if week in self.matchups:
-                for m in self.matchups[week]:
-                    if m.get('roster_id') == roster_id:
-                        return float(m.get('points', 0) or 0)
-            return 0.0
+            return self._week_points.get((roster_id, week), 0.0)
 
         # Render each round
-        for rnd in sorted(rounds.keys()):
-            games = sorted(rounds[rnd], key=lambda x: x.get('matchup_id', 0))
+        for _, games in groupby(bracket, key=lambda g: g.get('round', 0)):
             for g in games:
                 t1 = rosterid_to_team.get(g.get('t1'), f"R{g.get('t1')}")
                 t2 = rosterid_to_team.get(g.get('t2'), f"R{g.get('t2')}")
@@ -839,35 +1067,31 @@ class SleeperLog:
                 t2_short = t2[:15]
                 winner_short = winner_team[:15]
                 line = f"      ({seed1}) {t1_short:<15} {s1:>6.1f}  vs  ({seed2}) {t2_short:<15} {s2:>6.1f}  =>  \033[1m{winner_short}\033[0m\n"
-                output += line
-            output += "\n"
+                parts.append(line)
+            parts.append("\n")
 
-        return output
+        return "".join(parts)
     
     def create_draft_summary(self):
-        output = self.create_section_header("\033[1mDRAFT SUMMARY\033[0m")
+        parts = [_DRAFT_HEADER]
         
         if not self.draft_picks:
-            output += "      No draft data available.\n\n"
-            return output
+            parts.append("      No draft data available.\n\n")
+            return "".join(parts)
         
-        # Group picks by team
+        # Group picks by team; draft_picks is in (round, pick_no) order so each list is too
         picks_by_team = defaultdict(list)
         for pick in self.draft_picks:
             roster_id = pick.get('roster_id')
             if roster_id:
                 picks_by_team[roster_id].append(pick)
         
-        # Sort picks by round and pick number
-        for roster_id in picks_by_team:
-            picks_by_team[roster_id].sort(key=lambda x: (x.get('round', 0), x.get('pick_no', 0)))
-        
         # Display picks by team
         for roster_id in sorted(picks_by_team.keys()):
             team_name = self.get_team_name(roster_id)
             picks = picks_by_team[roster_id]
             
-            output += f"      \033[1m{team_name.upper()}\033[0m\n"
+            parts.append(f"      \033[1m{team_name.upper()}\033[0m\n")
             
             # Group picks into lines of 3
             for i in range(0, len(picks), 3):
@@ -879,25 +1103,25 @@ class SleeperLog:
                     pick_num = pick.get('pick_no', 0)
                     player_id = pick.get('player_id')
                     
-                    if player_id and player_id in self.players:
-                        player_name = self.players[player_id].get('full_name', 'Unknown')[:12]
-                        position = "(" + self.players[player_id].get('position', 'UNK') + ")"
+                    if player_id and player_id in self._player_full_names:
+                        player_name = self._player_full_names[player_id][:12]
+                        position = "(" + self._player_pos_team[player_id][0] + ")"
                         line += f"R{round_num:<02}.{pick_num:03d} {player_name:<12} {position:<5} "
                     else:
                         line += f"R{round_num:<02}.{pick_num:03d} {'Unknown':<12} (UNK) "
                 
-                output += line.rstrip() + "\n"
+                parts.append(line.rstrip() + "\n")
             
-            output += "\n"
+            parts.append("\n")
         
-        return output
+        return "".join(parts)
     
     def create_schedule_section(self):
-        output = self.create_section_header("\033[1mSCHEDULE\033[0m")
+        parts = [_SCHEDULE_HEADER]
         
         if not self.matchups:
-            output += "      No schedule data available.\n\n"
-            return output
+            parts.append("      No schedule data available.\n\n")
+            return "".join(parts)
         
         # Display each week's matchups
         for week in sorted(self.matchups.keys()):
@@ -905,17 +1129,11 @@ class SleeperLog:
             if not week_matchups:
                 continue
                 
-            output += f"      \033[1mWeek {week}\033[0m\n"
-            
-            # Group matchups by matchup_id
-            matchup_groups = defaultdict(list)
-            for matchup in week_matchups:
-                matchup_id = matchup.get('matchup_id')
-                if matchup_id is not None:
-                    matchup_groups[matchup_id].append(matchup)
+            parts.append(f"      \033[1mWeek {week}\033[0m\n")
             
-            # Display each matchup
-            for matchup_id in sorted(matchup_groups.keys()):
+            # Display each matchup (rows without a matchup_id aren't paired with anyone)
+            matchup_groups = self._matchup_groups[week]
+            for matchup_id in sorted(mid for mid in matchup_groups if mid is not None):
                 matchup_teams = matchup_groups[matchup_id]
                 if len(matchup_teams) >= 2:
                     team1 = matchup_teams[0]
@@ -929,15 +1147,15 @@ class SleeperLog:
                     
                     # Color the winner
                     if team1_points > team2_points:
-                        output += f"      \033[1m\033[32m{team1_name:<25}\033[0m {team1_points:>6.1f}  vs  {team2_name:<25} {team2_points:>6.1f}\n"
+                        parts.append(f"      {_BOLD_GREEN}{team1_name:<25}{_RESET} {team1_points:>6.1f}  vs  {team2_name:<25} {team2_points:>6.1f}\n")
                     elif team2_points > team1_points:
-                        output += f"      {team1_name:<25} {team1_points:>6.1f}  vs  \033[1m\033[32m{team2_name:<25}\033[0m {team2_points:>6.1f}\n"
+                        parts.append(f"      {team1_name:<25} {team1_points:>6.1f}  vs  {_BOLD_GREEN}{team2_name:<25}{_RESET} {team2_points:>6.1f}\n")
                     else:
-                        output += f"      {team1_name:<25} {team1_points:>6.1f}  vs  {team2_name:<25} {team2_points:>6.1f}\n"
+                        parts.append(f"      {team1_name:<25} {team1_points:>6.1f}  vs  {team2_name:<25} {team2_points:>6.1f}\n")
 
-            output += "\n"
+            parts.append("\n")
         
-        return output
+        return "".join(parts)
 
 
 def get_leagues_by_username(
@@ -970,23 +1188,28 @@ def get_leagues_by_username(
         start_year = end_year = int(season)
 
     try:
-        user_response = requests.get(user_url)
-        user_response.raise_for_status()
-        user_data = user_response.json()
+        with new_session() as session:
+            get = partial(session.get, timeout=REQUEST_TIMEOUT)
+            user_response = get(user_url)
+            user_response.raise_for_status()
+            user_data = load_json(user_response)
 
-        if not user_data or 'user_id' not in user_data:
-            print(f"User '{username}' not found.")
-            return None
+            if not user_data or 'user_id' not in user_data:
+                print(f"User '{username}' not found.")
+                return None
 
-        user_id = user_data['user_id']
-        leagues_info = defaultdict(list)
+            user_id = user_data['user_id']
 
-        for year in range(start_year, end_year + 1):
-            leagues_url = f"https://api.sleeper.app/v1/user/{user_id}/leagues/{sport}/{year}"
-            response = requests.get(leagues_url)
+            # One request per season; fetch them all at once rather than year by year
+            years = range(start_year, end_year + 1)
+            leagues_urls = [f"https://api.sleeper.app/v1/user/{user_id}/leagues/{sport}/{year}" for year in years]
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+                responses = list(executor.map(get, leagues_urls))
 
+        leagues_info = defaultdict(list)
+        for year, response in zip(years, responses):
             if response.status_code == 200:
-                for league in response.json():
+                for league in load_json(response):
                     leagues_info[year].append({
                         "name": league.get("name", "Unnamed League"),
                         "id": league.get("league_id", "Unknown ID")
@@ -1017,6 +1240,9 @@ def pick_league(leagues: Dict[int, List[Dict[str, str]]]) -> Optional[Dict[str,
         for year, league in all_leagues
     }
 
+    # Imported here because prompt_toolkit is slow to load and only the interactive picker needs it
+    from InquirerPy import inquirer
+
     selected_label = inquirer.select(
         message="Choose a league:",
         choices=list(label_to_league.keys())
@@ -1030,6 +1256,7 @@ def main():
     parser.add_argument("--league-id", "-l", dest="league_id", help="Sleeper league ID (overrides LEAGUE_ID env var)")
     parser.add_argument("--username", "-u", dest="username", help="Sleeper username used to search for leagues (overrides league-id)")
     parser.add_argument("--year", "-y", dest="year", help="Season year to narrow down league choices (used with --username)")
+    parser.add_argument("--refresh-players", dest="refresh_players", action="store_true", help="Ignore the cached NFL player list and download a fresh copy")
     args = parser.parse_args()
 
     if args.username:
@@ -1040,21 +1267,19 @@ def main():
             print(f"No leagues found for {args.username}")
             return
 
-    league_id = args.league_id or os.getenv("LEAGUE_ID")
+    league_id = args.league_id or os.environ.get("LEAGUE_ID")
     if not league_id:
-        print("No league ID or username provided.")
-        parser.print_help()
-        return
+        # Prints usage to stderr and exits with status 2 so scripts can detect the failure
+        parser.error("No league ID or username provided. Pass --league-id or --username, or set LEAGUE_ID.")
 
     try:
-        sleeper_log = SleeperLog(league_id)
+        sleeper_log = SleeperLog(league_id, refresh_players=args.refresh_players)
         sleeper_log.fetch_league_data()
         sleeper_log.generate_html_report()
         print("\nReport generation complete! See sleeper_log.html")
         
     except Exception as e:
         print(f"Error generating report: {str(e)}")
-        import traceback
         traceback.print_exc()
 
 if __name__ == "__main__":